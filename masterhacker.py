@@ -56,6 +56,10 @@ Advanced terminal width detection with comprehensive fallback chain:
 3. Fallback 2: TERM_COLS environment variable
 4. Final: Default 80-column assumption
 
+The detected tier is cached per process and refreshed when the terminal is
+resized (SIGWINCH, handler installed by main() only), or after a short TTL
+where SIGWINCH is unavailable or the module is used as a library.
+
 Special handling for:
 - Non-interactive terminals (pipes, redirection)
 - Terminal size detection failures
@@ -78,8 +82,9 @@ Safety features:
 
 ### Global State Variables
 - **discovered_targets**: List of systems found by scan command
+- **discovered_target_names**: Read-only name index over discovered_targets
 - **infiltrated_targets**: Set of successfully compromised systems
-- **system_status**: Dictionary of operational parameters and statistics
+- **system_status**: SystemStatus record of operational parameters and statistics
 - **unicode_mode**: Display character set preference ("auto", "on", "off")
 - **width_mode**: Terminal width override ("auto", "compact", "standard", "wide")
 
@@ -168,6 +173,9 @@ python masterhacker.py --width compact --interactive
 
 # ASCII mode for maximum compatibility
 python masterhacker.py --unicode off --script demo
+
+# Fast demo without animation delays (CI, screenshots)
+python masterhacker.py --script demo --no-delay
 ```
 
 ## Technical Requirements
@@ -189,14 +197,17 @@ Version: 2.0.7 (with comprehensive documentation)
 License: Open source parody/educational use
 """
 
-import argparse
+import math
 import os
 import random
 import shutil
+import signal
 import sys
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, Any
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Any
 
 # =============================================================================
 # CONSTANTS SECTION
@@ -208,6 +219,11 @@ DISPLAY_WIDTH_STANDARD_THRESHOLD: int = 99
 DISPLAY_WIDTH_WIDE_THRESHOLD: int = 100
 DISPLAY_DEFAULT_TERMINAL_WIDTH: int = 80
 
+# Display Mode Constants - accepted --unicode / --width values
+UNICODE_MODES: Tuple[str, ...] = ("auto", "on", "off")
+WIDTH_TIERS: Tuple[str, ...] = ("compact", "standard", "wide")      # explicit layouts
+WIDTH_MODES: Tuple[str, ...] = ("auto",) + WIDTH_TIERS
+
 # Timing Constants - Animation Delays
 TIMING_PROGRESS_DEFAULT: float = 0.08
 TIMING_PROGRESS_SCAN: float = 0.12
@@ -219,6 +235,8 @@ TIMING_PROGRESS_COUNTERTRACE: float = 0.11
 TIMING_ACCESS_GRANTED_DELAY: float = 1.0
 TIMING_WARNING_DELAY: float = 1.5
 TIMING_PROGRESS_END_DELAY: float = 0.2
+TIMING_DELAY_SCALE_DEFAULT: float = 1.0    # Multiplier applied to every delay
+TIMING_DELAY_SCALE_MAX: float = 100.0      # Slowest allowed pacing (--speed 0.01)
 
 # Progress Bar Constants
 PROGRESS_BAR_STEPS_DEFAULT: int = 20
@@ -229,10 +247,26 @@ PROGRESS_BAR_STEPS_HACK: int = 30
 PROGRESS_BAR_STEPS_TRACE: int = 25
 PROGRESS_BAR_STEPS_COUNTERTRACE: int = 22
 PROGRESS_BAR_WIDTH: int = 52
+PROGRESS_CHARS_ASCII: Tuple[str, str] = ('#', '.')      # (filled, empty)
+PROGRESS_CHARS_UNICODE: Tuple[str, str] = ('█', '░')    # (filled, empty)
+PROGRESS_BAR_RULE: str = "+" + "-" * PROGRESS_BAR_WIDTH + "+"
+
+# Terminal Width Fallback Constants
+TERMINAL_WIDTH_ENV_VARS: Tuple[str, ...] = ("COLUMNS", "TERM_COLS")   # checked in order
+
+# Terminal Width Cache Constants
+TERMINAL_WIDTH_CACHE_TTL: float = 0.5
+
+# Unicode Detection Constants
+UTF8_LOCALE_ENV_VARS: Tuple[str, ...] = ("LC_ALL", "LC_CTYPE", "LANG")
+UNICODE_TERM_PREFIXES: Tuple[str, ...] = ("xterm-256color", "screen-256color", "tmux-256color")
 
 # Unicode Probe Constants
 UNICODE_PROBE_TIMEOUT: float = 0.5
 UNICODE_PROBE_SELECT_TIMEOUT: int = 0
+UNICODE_PROBE_READ_SIZE: int = 32
+UNICODE_PROBE_QUERY: bytes = '\033[s╔\033[6n'.encode('utf-8')   # save, glyph, query
+UNICODE_PROBE_RESTORE: bytes = b'\033[u\033[K'                   # restore, clear line
 
 # System Status Constants
 STATUS_ONLINE: str = "ONLINE"
@@ -248,6 +282,15 @@ DEMO_RANDOM_SEED: int = 1337
 DEMO_HACK_SYSTEMS: int = 5
 DEMO_HACK_CREDITS: int = 1337
 DEMO_DISCOVERED_TARGETS_COUNT: int = 3
+DEMO_COMMANDS: Tuple[str, ...] = (
+    "scan",
+    "infiltrate MAINFRAME-7",
+    "hack",
+    "trace QUANTUM-DB",
+    "countertrace",
+    "status",
+    "exit"
+)
 
 # System State Default Values
 DEFAULT_CONNECTIONS: int = 3
@@ -265,10 +308,13 @@ COORDINATE_PRECISION: int = 4
 PROGRESS_PERCENTAGE_WIDTH: int = 3
 PROGRESS_DOTS_WIDTH: int = 3
 PROGRESS_DOT_CYCLE_MODULO: int = 3
+PROGRESS_DOTS_CYCLE: Tuple[str, ...] = ("...", "..", ".")    # indexed by step % modulo
+PROGRESS_DELTA_RESYNC_INTERVAL: int = 8    # Full redraw every N delta frames
 
 # Command Parsing Constants
 COMMAND_ARGS_FIRST_INDEX: int = 0
 COMMAND_PARTS_FIRST_INDEX: int = 0
+COMMAND_HEAD_MAX_SPLIT: int = 1    # Split off the command word only
 
 # Array Index Constants
 ARRAY_FIRST_ELEMENT: int = 0
@@ -277,6 +323,13 @@ ARRAY_SECOND_ELEMENT: int = 1
 # Version and System Information Constants
 VERSION_NUMBER: str = "2.1.4"
 
+# Targets Reported by the scan Command - (target_name, security) in display order
+SCAN_TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("MAINFRAME-7", "low"),
+    ("QUANTUM-DB", "high"),
+    ("SATELLITE-X", "medium"),
+)
+
 # Location Constants for Trace Command
 PREDEFINED_LOCATIONS: Dict[str, Tuple[str, str]] = {
     "QUANTUM-DB": ("37.7749 deg N, 122.4194 deg W", "CyberCorp Industries"),
@@ -286,6 +339,34 @@ PREDEFINED_LOCATIONS: Dict[str, Tuple[str, str]] = {
     "CRYPTO-VAULT": ("52.5200 deg N, 13.4050 deg E", "SecureMax GmbH"),
     "DATA-CENTER": ("34.0522 deg N, 118.2437 deg W", "InfoTech Solutions")
 }
+TRACE_FALLBACK_ISPS: Tuple[str, ...] = ("CyberCorp Industries", "TechMax Solutions", "DataFlow Systems")
+
+# Help Text for the help Command
+HELP_TEXT: str = """Available commands:
+  help                    - Show this help
+  scan                    - Scan for targets
+  decrypt                 - Decrypt intercepted data
+  infiltrate <target>     - Infiltrate specified target
+  hack                    - Execute hack sequence
+  trace <target>          - Trace target location
+  countertrace|evade      - Counter enemy traces
+  status                  - Show system status
+  clear                   - Clear terminal
+  exit                    - Exit terminal"""
+
+# Message Constants for Decrypt Command
+DECRYPT_MESSAGES: Tuple[str, ...] = (
+    "THE CAKE IS A LIE",
+    "TRUST NO ONE",
+    "FOLLOW THE WHITE RABBIT",
+    "THE MATRIX HAS YOU",
+    "WAKE UP NEO",
+    "I AM ROOT"
+)
+
+# Screen Control Constants
+ANSI_CLEAR_SCREEN: str = "\033[H\033[2J\033[3J"   # home, clear screen, clear scrollback (as clear(1))
+CLEAR_SCREEN_COMMAND: str = 'cls' if os.name == 'nt' else 'clear'   # fallback shell command
 
 # Size Validation Constants
 SIZE_GREATER_THAN_ZERO: int = 0
@@ -302,20 +383,23 @@ EXIT_FAILURE: int = 1
 # OPTIONAL SYSTEM-SPECIFIC IMPORTS
 # =============================================================================
 
-# Optional imports for Unix-like systems (for Unicode width probing)
-try:
-    import select
-    import termios
-    import tty
-    HAS_UNIX_TTY = True
-except ImportError:
-    HAS_UNIX_TTY = False
+# Unix-like TTY support (for Unicode width probing). The select, termios and
+# tty modules are imported lazily by probe_unicode_width(), the only user, so
+# a normal run never pays for them. Platforms without a real termios are
+# ruled out here, so the probe never reaches the ImportError path on them.
+NON_TTY_PLATFORMS: Tuple[str, ...] = ("win32", "emscripten", "wasi")
+HAS_UNIX_TTY: bool = sys.platform not in NON_TTY_PLATFORMS
 
 
 # =============================================================================
 # ASCII ART CONSTANTS - WIDTH-TIERED SYSTEM
 # =============================================================================
 
+# The art below is hand-tuned per tier and per character set: border widths,
+# row padding and letterforms differ between the ASCII and Unicode variants,
+# so the boxes are kept as literals rather than generated from a template.
+# Only one variant is ever rendered per call (see ART LOOKUP TABLES below).
+
 # Compact Mode: ≤62 characters
 COMPACT_ASCII_BANNER = """
  +==========================================================+
@@ -660,11 +744,248 @@ UNICODE_BANNER = STANDARD_UNICODE_BANNER
 UNICODE_ACCESS_GRANTED = STANDARD_UNICODE_ACCESS_GRANTED
 UNICODE_WARNING_BOX = STANDARD_UNICODE_WARNING_BOX
 
+# =============================================================================
+# ART LOOKUP TABLES - KEYED BY (USE_UNICODE, WIDTH_TIER)
+# =============================================================================
+
+# Built once at import so the display getters resolve their art with a single
+# dict lookup instead of walking a nested if/elif chain on every call.
+_BANNER_TABLE: Dict[Tuple[bool, str], str] = {
+    (False, 'compact'): COMPACT_ASCII_BANNER,
+    (False, 'standard'): STANDARD_ASCII_BANNER,
+    (False, 'wide'): WIDE_ASCII_BANNER,
+    (True, 'compact'): COMPACT_UNICODE_BANNER,
+    (True, 'standard'): STANDARD_UNICODE_BANNER,
+    (True, 'wide'): WIDE_UNICODE_BANNER,
+}
+
+_ACCESS_GRANTED_TABLE: Dict[Tuple[bool, str], str] = {
+    (False, 'compact'): COMPACT_ACCESS_GRANTED,
+    (False, 'standard'): STANDARD_ACCESS_GRANTED,
+    (False, 'wide'): WIDE_ACCESS_GRANTED,
+    (True, 'compact'): COMPACT_UNICODE_ACCESS_GRANTED,
+    (True, 'standard'): STANDARD_UNICODE_ACCESS_GRANTED,
+    (True, 'wide'): WIDE_UNICODE_ACCESS_GRANTED,
+}
+
+_WARNING_BOX_TABLE: Dict[Tuple[bool, str], str] = {
+    (False, 'compact'): COMPACT_WARNING_BOX,
+    (False, 'standard'): STANDARD_WARNING_BOX,
+    (False, 'wide'): WIDE_WARNING_BOX,
+    (True, 'compact'): COMPACT_UNICODE_WARNING_BOX,
+    (True, 'standard'): STANDARD_UNICODE_WARNING_BOX,
+    (True, 'wide'): WIDE_UNICODE_WARNING_BOX,
+}
+
 # =============================================================================
 # APPLICATION STATE MANAGEMENT
 # =============================================================================
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class SystemStatus(Mapping):
+    """
+    Operational parameters and statistics shown by the status command.
+    
+    Fixed-field record replacing the former Dict[str, Any]. Fields are read
+    as attributes (state.system_status.credits). For compatibility it is also
+    a read-only Mapping over the field names - indexing, iteration, len(),
+    get(), keys()/items()/values() and == against a dict behave as they did
+    for the old dict - and item assignment is supported for existing keys.
+    
+    Fields:
+        online (bool): Connection status
+        security_level (str): Current security level
+        connections (int): Active connection count
+        firewall (bool): Firewall status
+        stealth (bool): Stealth mode status
+        compromised_systems (int): Number of compromised systems
+        credits (int): Current credit balance
+        
+    Example:
+        >>> status = SystemStatus()
+        >>> status.credits = 1337
+        >>> status["credits"]
+        1337
+        >>> "firewall" in status
+        True
+        >>> dict(status) == status
+        True
+    """
+    
+    online: bool = True
+    security_level: str = STATUS_SECURITY_MAXIMUM
+    connections: int = DEFAULT_CONNECTIONS
+    firewall: bool = True
+    stealth: bool = True
+    compromised_systems: int = DEFAULT_COMPROMISED_SYSTEMS
+    credits: int = DEFAULT_CREDITS
+    
+    def __getitem__(self, key: str) -> Any:
+        """Return a field by name, like dict indexing (KeyError if unknown)."""
+        if key not in SYSTEM_STATUS_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field by name, like dict assignment (KeyError if unknown)."""
+        if key not in SYSTEM_STATUS_KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: object) -> bool:
+        """Return True if key names one of the status fields."""
+        return key in SYSTEM_STATUS_KEYS
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names in declaration order, like a dict."""
+        return iter(SYSTEM_STATUS_KEYS)
+    
+    def __len__(self) -> int:
+        """Return the number of status fields."""
+        return len(SYSTEM_STATUS_KEYS)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field with another SystemStatus or any mapping."""
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+
+# Field names of SystemStatus, in declaration order
+SYSTEM_STATUS_KEYS: Tuple[str, ...] = tuple(f.name for f in fields(SystemStatus))
+
+# Expected type and description of each SystemStatus field, for validation
+SYSTEM_STATUS_TYPES: Dict[str, Tuple[type, str]] = {
+    "online": (bool, "a boolean"),
+    "security_level": (str, "a string"),
+    "connections": (int, "an integer"),
+    "firewall": (bool, "a boolean"),
+    "stealth": (bool, "a boolean"),
+    "compromised_systems": (int, "an integer"),
+    "credits": (int, "an integer"),
+}
+
+
+def _is_type(value: Any, expected_type: type) -> bool:
+    """
+    isinstance() check that does not let bool pass as a number.
+    
+    bool is a subclass of int, so isinstance(True, int) is True; numeric
+    fields must reject True/False explicitly.
+    
+    Args:
+        value (Any): Value to check.
+        expected_type (type): Required type (bool, str, int, float, ...).
+        
+    Returns:
+        bool: True if value is an instance of expected_type and is not a
+              bool standing in for a number.
+    """
+    if isinstance(value, bool) and expected_type is not bool:
+        return False
+    return isinstance(value, expected_type)
+
+
+class TargetList(list):
+    """
+    List of (target_name, target_type) pairs with a live name index.
+    
+    Behaves like the plain list ApplicationState.discovered_targets used to
+    be, but keeps a name -> type dict in step with every mutation, so "was
+    this target scanned?" is a single hash lookup. append() updates the index
+    incrementally; every other mutation rebuilds it (scans hold a handful of
+    targets). Entries that are not (name, type) pairs are left out of the
+    index and reported by ApplicationState.validate_state().
+    
+    Example:
+        >>> targets = TargetList([("MAINFRAME-7", "low")])
+        >>> targets.append(("QUANTUM-DB", "high"))
+        >>> "QUANTUM-DB" in targets.names
+        True
+    """
+    
+    __slots__ = ("_index",)
+    
+    def __init__(self, targets: Iterable[Tuple[str, str]] = ()) -> None:
+        super().__init__(targets)
+        self._reindex()
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Copy and pickle as a fresh TargetList, so the index is rebuilt."""
+        return (type(self), (list(self),))
+    
+    @property
+    def names(self) -> AbstractSet[str]:
+        """Read-only, live set-like view of the indexed target names."""
+        return self._index.keys()
+    
+    def _add_to_index(self, target: Any) -> None:
+        """Index one entry; the first entry for a name wins, as in a scan."""
+        if isinstance(target, tuple) and len(target) == 2:
+            self._index.setdefault(target[0], target[1])
+    
+    def _reindex(self) -> None:
+        """Rebuild the name index from the list contents."""
+        self._index: Dict[str, str] = {}
+        for target in self:
+            self._add_to_index(target)
+    
+    def append(self, target: Tuple[str, str]) -> None:
+        super().append(target)
+        self._add_to_index(target)
+    
+    def extend(self, targets: Iterable[Tuple[str, str]]) -> None:
+        super().extend(targets)
+        self._reindex()
+    
+    def insert(self, index: int, target: Tuple[str, str]) -> None:
+        super().insert(index, target)
+        self._reindex()
+    
+    def remove(self, target: Tuple[str, str]) -> None:
+        super().remove(target)
+        self._reindex()
+    
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        target = super().pop(index)
+        self._reindex()
+        return target
+    
+    def clear(self) -> None:
+        super().clear()
+        self._index = {}
+    
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+    
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
+    
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+    
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._reindex()
+    
+    def __iadd__(self, targets: Iterable[Tuple[str, str]]) -> "TargetList":
+        self.extend(targets)
+        return self
+    
+    def __imul__(self, count: int) -> "TargetList":
+        super().__imul__(count)
+        self._reindex()
+        return self
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ApplicationState:
     """
     Centralized application state management for Master Hacker Terminal.
@@ -684,15 +1005,25 @@ class ApplicationState:
             - "compact": Force compact mode (≤62 chars)
             - "standard": Force standard mode (63-99 chars)
             - "wide": Force wide mode (≥100 chars)
+            
+        delay_scale (float): Multiplier applied to all animation delays
+            - 1.0: Normal cinematic pacing (default)
+            - 0.5: Twice as fast (--speed 2)
+            - 0.0: No delays at all (--no-delay)
     
     Operation State:
         discovered_targets (List[Tuple[str, str]]): Systems found by scan command
             Format: [(target_name, target_type), ...]
+            Any list assigned here (constructor argument or plain assignment)
+            is wrapped in a TargetList, which keeps the name index current
+            
+        discovered_target_names (AbstractSet[str]): Read-only property; live
+            O(1) name index over discovered_targets, used by cmd_infiltrate
             
         infiltrated_targets (Set[str]): Successfully compromised systems
             Contains target names that have been successfully infiltrated
             
-        system_status (Dict[str, Any]): Operational parameters and statistics
+        system_status (SystemStatus): Operational parameters and statistics
             - online: Connection status (bool)
             - security_level: Current security level (int)
             - connections: Active connection count (int)
@@ -705,6 +1036,11 @@ class ApplicationState:
         All state modifications should go through validation methods to ensure
         data integrity and prevent invalid configurations.
         
+    Note:
+        On Python 3.10+ the class is slotted, so assigning an attribute that
+        is not declared above raises AttributeError instead of silently
+        creating it.
+        
     Example:
         >>> state = ApplicationState()
         >>> state.unicode_mode = "on"
@@ -716,19 +1052,33 @@ class ApplicationState:
     # Display configuration
     unicode_mode: str = "auto"
     width_mode: str = "auto"
+    delay_scale: float = TIMING_DELAY_SCALE_DEFAULT
     
     # Operation state
     discovered_targets: List[Tuple[str, str]] = field(default_factory=list)
     infiltrated_targets: Set[str] = field(default_factory=set)
-    system_status: Dict[str, Any] = field(default_factory=lambda: {
-        "online": True,
-        "security_level": STATUS_SECURITY_MAXIMUM,
-        "connections": DEFAULT_CONNECTIONS,
-        "firewall": True,
-        "stealth": True,
-        "compromised_systems": DEFAULT_COMPROMISED_SYSTEMS,
-        "credits": DEFAULT_CREDITS
-    })
+    system_status: SystemStatus = field(default_factory=SystemStatus)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Wrap lists assigned to discovered_targets in an indexed TargetList."""
+        if (name == "discovered_targets" and isinstance(value, list)
+                and not isinstance(value, TargetList)):
+            value = TargetList(value)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def discovered_target_names(self) -> AbstractSet[str]:
+        """
+        Names of the discovered targets, as a read-only set-like view.
+        
+        Maintained by TargetList on every change to discovered_targets, so it
+        cannot go stale however the list is populated.
+        """
+        targets = self.discovered_targets
+        if isinstance(targets, TargetList):
+            return targets.names
+        # Not a list at all - validate_state() reports that; answer anyway
+        return {target[0] for target in targets}
     
     def validate_state(self) -> bool:
         """
@@ -740,9 +1090,12 @@ class ApplicationState:
         Validation Rules:
             - unicode_mode must be one of: "auto", "on", "off"
             - width_mode must be one of: "auto", "compact", "standard", "wide"
+            - delay_scale must be a finite int or float (bools rejected)
+              between 0 and TIMING_DELAY_SCALE_MAX
             - discovered_targets must be list of (str, str) tuples
+            - discovered_target_names must match the names in discovered_targets
             - infiltrated_targets must be set of strings
-            - system_status must contain all required keys with correct types
+            - system_status must be a SystemStatus with correctly typed fields
             - infiltrated_targets should be subset of discovered target names
             
         Returns:
@@ -758,14 +1111,21 @@ class ApplicationState:
             ValueError: Invalid unicode_mode: invalid
         """
         # Validate unicode_mode
-        valid_unicode_modes = {"auto", "on", "off"}
-        if self.unicode_mode not in valid_unicode_modes:
-            raise ValueError(f"Invalid unicode_mode: {self.unicode_mode}. Must be one of {valid_unicode_modes}")
+        if self.unicode_mode not in UNICODE_MODES:
+            raise ValueError(f"Invalid unicode_mode: {self.unicode_mode}. Must be one of {UNICODE_MODES}")
         
         # Validate width_mode
-        valid_width_modes = {"auto", "compact", "standard", "wide"}
-        if self.width_mode not in valid_width_modes:
-            raise ValueError(f"Invalid width_mode: {self.width_mode}. Must be one of {valid_width_modes}")
+        if self.width_mode not in WIDTH_MODES:
+            raise ValueError(f"Invalid width_mode: {self.width_mode}. Must be one of {WIDTH_MODES}")
+        
+        # Validate delay_scale
+        if (not (_is_type(self.delay_scale, int) or _is_type(self.delay_scale, float))
+                or not math.isfinite(self.delay_scale)
+                or not 0 <= self.delay_scale <= TIMING_DELAY_SCALE_MAX):
+            raise ValueError(
+                f"Invalid delay_scale: {self.delay_scale}. "
+                f"Must be a finite number between 0 and {TIMING_DELAY_SCALE_MAX}"
+            )
         
         # Validate discovered_targets structure
         if not isinstance(self.discovered_targets, list):
@@ -777,6 +1137,10 @@ class ApplicationState:
             if not isinstance(target[0], str) or not isinstance(target[1], str):
                 raise ValueError(f"discovered_targets[{i}] must contain two strings")
         
+        # Only reachable if the index was bypassed (e.g. list.append(targets, ...))
+        if set(self.discovered_target_names) != {name for name, _ in self.discovered_targets}:
+            raise ValueError("discovered_target_names is out of sync with discovered_targets")
+        
         # Validate infiltrated_targets structure
         if not isinstance(self.infiltrated_targets, set):
             raise ValueError("infiltrated_targets must be a set")
@@ -786,36 +1150,17 @@ class ApplicationState:
                 raise ValueError("All infiltrated_targets must be strings")
         
         # Validate system_status structure
-        required_status_keys = {
-            "online", "security_level", "connections", 
-            "firewall", "stealth", "compromised_systems", "credits"
-        }
-        
-        if not isinstance(self.system_status, dict):
-            raise ValueError("system_status must be a dictionary")
-        
-        missing_keys = required_status_keys - self.system_status.keys()
-        if missing_keys:
-            raise ValueError(f"system_status missing required keys: {missing_keys}")
+        status = self.system_status
+        if not isinstance(status, SystemStatus):
+            raise ValueError("system_status must be a SystemStatus instance")
         
         # Validate system_status value types
-        if not isinstance(self.system_status["online"], bool):
-            raise ValueError("system_status['online'] must be a boolean")
-        if not isinstance(self.system_status["security_level"], str):
-            raise ValueError("system_status['security_level'] must be a string")
-        if not isinstance(self.system_status["connections"], int):
-            raise ValueError("system_status['connections'] must be an integer")
-        if not isinstance(self.system_status["firewall"], bool):
-            raise ValueError("system_status['firewall'] must be a boolean")
-        if not isinstance(self.system_status["stealth"], bool):
-            raise ValueError("system_status['stealth'] must be a boolean")
-        if not isinstance(self.system_status["compromised_systems"], int):
-            raise ValueError("system_status['compromised_systems'] must be an integer")
-        if not isinstance(self.system_status["credits"], int):
-            raise ValueError("system_status['credits'] must be an integer")
+        for key, (expected_type, description) in SYSTEM_STATUS_TYPES.items():
+            if not _is_type(getattr(status, key), expected_type):
+                raise ValueError(f"system_status['{key}'] must be {description}")
         
         # Validate logical consistency
-        discovered_target_names = {target[0] for target in self.discovered_targets}
+        discovered_target_names = self.discovered_target_names
         invalid_infiltrated = self.infiltrated_targets - discovered_target_names
         if invalid_infiltrated and discovered_target_names:
             # Only validate consistency if we have discovered targets
@@ -842,12 +1187,39 @@ class ApplicationState:
             raise ValueError("Target name and type cannot be empty")
         
         # Check for duplicates
-        for existing_name, _ in self.discovered_targets:
-            if existing_name == name:
-                raise ValueError(f"Target {name} already exists in discovered targets")
+        if self.has_discovered_target(name):
+            raise ValueError(f"Target {name} already exists in discovered targets")
         
         self.discovered_targets.append((name, target_type))
     
+    def has_discovered_target(self, name: str) -> bool:
+        """
+        Check whether a target name was found by a previous scan.
+        
+        A single lookup in discovered_target_names, the index that
+        TargetList keeps current however discovered_targets was populated
+        (constructor argument, direct assignment, add_discovered_target() or
+        a scan).
+        
+        Args:
+            name (str): Target system name (e.g., "MAINFRAME-7")
+            
+        Returns:
+            bool: True if a discovered target has this exact name.
+        """
+        return name in self.discovered_target_names
+    
+    def set_discovered_targets(self, targets: Sequence[Tuple[str, str]]) -> None:
+        """
+        Replace the discovered targets with a new scan result.
+        
+        Args:
+            targets (Sequence[Tuple[str, str]]): (target_name, target_type)
+                pairs in display order. Copied into a new TargetList, so a
+                constant such as SCAN_TARGETS can be passed directly.
+        """
+        self.discovered_targets = TargetList(targets)
+    
     def add_infiltrated_target(self, name: str) -> None:
         """
         Mark a target as successfully infiltrated.
@@ -867,6 +1239,9 @@ class ApplicationState:
         """
         Update a system status value with validation.
         
+        Only the updated field is type-checked; a full validate_state() sweep
+        is left to callers that need it (it covers every target and field).
+        
         Args:
             key (str): Status key to update
             value (Any): New value for the status key
@@ -874,32 +1249,32 @@ class ApplicationState:
         Raises:
             ValueError: If key is invalid or value type is incorrect.
         """
-        if key not in self.system_status:
+        if key not in SYSTEM_STATUS_KEYS:
             raise ValueError(f"Invalid system status key: {key}")
         
-        # Update and then validate
-        self.system_status[key] = value
-        self.validate_state()
+        # Check only the field being changed, before assigning, so a rejected
+        # value never reaches the state; the rest of the state is untouched
+        expected_type, description = SYSTEM_STATUS_TYPES[key]
+        if not _is_type(value, expected_type):
+            raise ValueError(f"system_status['{key}'] must be {description}")
+        
+        setattr(self.system_status, key, value)
     
     def reset_state(self) -> None:
         """
         Reset application state to initial defaults.
         
         Useful for testing and demo modes that need consistent starting state.
+        The cached terminal width tier is discarded too, so the next display
+        re-detects it against the current stdout.
         """
         self.unicode_mode = "auto"
         self.width_mode = "auto"
+        self.delay_scale = TIMING_DELAY_SCALE_DEFAULT
+        _invalidate_width_cache()
         self.discovered_targets.clear()
         self.infiltrated_targets.clear()
-        self.system_status = {
-            "online": True,
-            "security_level": STATUS_SECURITY_MAXIMUM,
-            "connections": DEFAULT_CONNECTIONS,
-            "firewall": True,
-            "stealth": True,
-            "compromised_systems": DEFAULT_COMPROMISED_SYSTEMS,
-            "credits": DEFAULT_CREDITS
-        }
+        self.system_status = SystemStatus()
 
 
 # Global application state instance
@@ -909,6 +1284,7 @@ app_state = ApplicationState()
 # UTILITY FUNCTIONS - TERMINAL AND UNICODE DETECTION
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def utf8_env_check() -> bool:
     """
     Check if environment variables suggest UTF-8 support.
@@ -921,6 +1297,11 @@ def utf8_env_check() -> bool:
         bool: True if any environment variable contains UTF-8 indicators,
               False otherwise.
               
+    Note:
+        The result is cached for the process lifetime since the locale
+        environment does not change mid-run. Use _reset_unicode_cache()
+        to force re-detection.
+              
     Example:
         >>> # With LANG=en_US.UTF-8
         >>> utf8_env_check()
@@ -929,12 +1310,17 @@ def utf8_env_check() -> bool:
         >>> utf8_env_check()
         False
     """
-    for var in ("LC_ALL", "LC_CTYPE", "LANG"):
-        val = os.environ.get(var, "")
-        if "UTF-8" in val.upper() or "utf8" in val.lower():
+    for var in UTF8_LOCALE_ENV_VARS:
+        val = os.environ.get(var)
+        if not val:
+            continue
+        # One case-fold per value; matches both "UTF-8" and "utf8" spellings
+        val = val.lower()
+        if "utf-8" in val or "utf8" in val:
             return True
     return False
 
+@lru_cache(maxsize=1)
 def terminal_hints_unicode() -> bool:
     """
     Check if TERM environment variable suggests Unicode capability.
@@ -950,6 +1336,8 @@ def terminal_hints_unicode() -> bool:
     Note:
         This is a heuristic check - modern terminals like xterm-256color,
         screen-256color, and tmux-256color generally handle Unicode well.
+        The result is cached for the process lifetime. Prefixes live in
+        UNICODE_TERM_PREFIXES.
         
     Example:
         >>> # With TERM=xterm-256color
@@ -960,9 +1348,33 @@ def terminal_hints_unicode() -> bool:
         False
     """
     term = os.environ.get("TERM", "").lower()
-    unicode_terms = ("xterm-256color", "screen-256color", "tmux-256color")
-    return any(term.startswith(t) for t in unicode_terms)
+    # str.startswith accepts a tuple, so all prefixes are tested in one call
+    return term.startswith(UNICODE_TERM_PREFIXES)
 
+def stdout_supports_ansi() -> bool:
+    """
+    Check if stdout is a terminal that understands ANSI cursor control.
+    
+    Returns:
+        bool: True for TTYs on Unix-like systems and in Windows Terminal
+              (WT_SESSION set), False for pipes, files and legacy Windows
+              consoles.
+              
+    Note:
+        Not cached: sys.stdout may be replaced at runtime (tests, wrappers),
+        and the check is a single isatty() call.
+        
+    Example:
+        >>> # In an xterm
+        >>> stdout_supports_ansi()
+        True
+        >>> # With output redirected to a file
+        >>> stdout_supports_ansi()
+        False
+    """
+    return sys.stdout.isatty() and (os.name != 'nt' or "WT_SESSION" in os.environ)
+
+@lru_cache(maxsize=1)
 def probe_unicode_width() -> bool:
     """
     Perform a safe probe to test if Unicode box-drawing characters render correctly.
@@ -984,10 +1396,13 @@ def probe_unicode_width() -> bool:
               
     Note:
         - Only works on Unix-like systems with TTY support
+        - select/termios/tty are imported on first use, not at module load
         - Skipped on Windows legacy consoles
         - Uses a 0.5-second timeout for terminal response
         - Always restores terminal state, even on errors
         - Returns False for non-interactive terminals (pipes, redirects)
+        - The result is cached for the process lifetime, so the raw-mode
+          round trip happens at most once; _reset_unicode_cache() clears it
         
     Safety Features:
         - Comprehensive error handling for all terminal operations
@@ -1013,35 +1428,38 @@ def probe_unicode_width() -> bool:
     # Skip probe on Windows legacy consoles
     if os.name == 'nt' and os.environ.get("TERM") != "xterm-256color":
         return False
+    
+    try:
+        import select
+        import termios
+        import tty
+    except ImportError:
+        return False
         
     try:
         # Test requires raw terminal mode
         old_attrs = termios.tcgetattr(sys.stdin)
         tty.setraw(sys.stdin)
         
-        # Save cursor position
-        sys.stdout.write('\033[s')
-        sys.stdout.flush()
-        
-        # Test simple Unicode box drawing character
-        sys.stdout.write('╔')
-        sys.stdout.flush()
-        
-        # Query cursor position
-        sys.stdout.write('\033[6n')
+        # Save cursor position, write a Unicode box drawing character and
+        # query the cursor position in a single write on the raw fd, after
+        # flushing any pending text so output ordering is preserved
         sys.stdout.flush()
+        os.write(sys.stdout.fileno(), UNICODE_PROBE_QUERY)
         
         # Read response with timeout - increased to 0.5s for slower terminals
         ready, _, _ = select.select([sys.stdin], [], [], UNICODE_PROBE_TIMEOUT)
         if ready:
-            # Read available data without blocking
-            response = ""
-            while select.select([sys.stdin], [], [], UNICODE_PROBE_SELECT_TIMEOUT) == ([sys.stdin], [], []):
-                char = sys.stdin.read(STEP_INCREMENT)
-                response += char
-                if char == 'R':  # End of position response
-                    break
-            result = 'R' in response  # Got a position response
+            # Drain the whole position report with one read; only if the
+            # terminal delivered it in pieces, pick up whatever else is
+            # already pending (zero-timeout select) until the final 'R'
+            fd = sys.stdin.fileno()
+            response = os.read(fd, UNICODE_PROBE_READ_SIZE)
+            while (b'R' not in response and response
+                   and len(response) < UNICODE_PROBE_READ_SIZE
+                   and select.select([fd], [], [], UNICODE_PROBE_SELECT_TIMEOUT)[0]):
+                response += os.read(fd, UNICODE_PROBE_READ_SIZE - len(response))
+            result = b'R' in response  # Got a position response
         else:
             result = False
             
@@ -1053,13 +1471,33 @@ def probe_unicode_width() -> bool:
     finally:
         try:
             # Always restore cursor and terminal state
-            sys.stdout.write('\033[u')     # Restore cursor
-            sys.stdout.write('\033[K')     # Clear line
-            sys.stdout.flush()
+            os.write(sys.stdout.fileno(), UNICODE_PROBE_RESTORE)
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_attrs)
         except (OSError, ValueError):
             pass
 
+@lru_cache(maxsize=1)
+def _auto_unicode() -> bool:
+    """
+    Cached auto-detection result used by should_use_unicode() in "auto" mode.
+    
+    Returns:
+        bool: True if both the locale and TERM hints suggest Unicode support.
+    """
+    return utf8_env_check() and terminal_hints_unicode()
+
+def _reset_unicode_cache() -> None:
+    """
+    Discard cached Unicode detection results so the next lookup re-probes.
+    
+    Called whenever the Unicode mode is (re)configured so that detection
+    always reflects the environment at configuration time.
+    """
+    utf8_env_check.cache_clear()
+    terminal_hints_unicode.cache_clear()
+    probe_unicode_width.cache_clear()
+    _auto_unicode.cache_clear()
+
 def should_use_unicode(state: Optional[ApplicationState] = None) -> bool:
     """
     Determine if Unicode should be used based on current mode and environment.
@@ -1079,6 +1517,7 @@ def should_use_unicode(state: Optional[ApplicationState] = None) -> bool:
     Auto-detection checks:
         1. UTF-8 environment variables (LC_ALL, LC_CTYPE, LANG)
         2. Terminal capability hints from TERM variable
+        The combined result is computed once and cached via _auto_unicode().
         
     Returns:
         bool: True if Unicode box-drawing characters should be used,
@@ -1109,9 +1548,9 @@ def should_use_unicode(state: Optional[ApplicationState] = None) -> bool:
     elif state.unicode_mode == "on":
         return True
     elif state.unicode_mode == "auto":
-        # Auto-detection: fast, non-blocking checks only
+        # Auto-detection: fast, non-blocking checks only, cached per process
         # Skip the problematic width probe that blocks execution
-        return (utf8_env_check() and terminal_hints_unicode())
+        return _auto_unicode()
     return False
 
 
@@ -1119,6 +1558,40 @@ def should_use_unicode(state: Optional[ApplicationState] = None) -> bool:
 # DISPLAY FUNCTIONS - BANNERS AND UI ELEMENTS
 # =============================================================================
 
+def _display_key(state: Optional[ApplicationState] = None) -> Tuple[bool, str]:
+    """
+    Resolve the (use_unicode, width_tier) key used by the art lookup tables.
+
+    Args:
+        state (ApplicationState, optional): Application state instance. If None,
+              uses the global app_state instance.
+
+    Returns:
+        Tuple[bool, str]: Unicode decision and resolved width tier.
+    """
+    return should_use_unicode(state), get_width_mode(state)
+
+
+def _sleep(seconds: float, state: Optional[ApplicationState] = None) -> None:
+    """
+    Sleep for an animation delay, scaled by the state's delay_scale.
+    
+    Args:
+        seconds (float): Unscaled delay in seconds (one of the TIMING_* values).
+        state (ApplicationState, optional): Application state instance. If None,
+              uses the global app_state instance.
+              
+    Note:
+        A delay_scale of 0 (--no-delay) skips the sleep call entirely.
+    """
+    if state is None:
+        state = app_state
+    
+    scaled = seconds * state.delay_scale
+    if scaled > 0:
+        time.sleep(scaled)
+
+
 def get_banner(state: Optional[ApplicationState] = None) -> str:
     """
     Get the appropriate banner art based on Unicode mode and terminal width.
@@ -1147,6 +1620,7 @@ def get_banner(state: Optional[ApplicationState] = None) -> str:
     Dependencies:
         - get_width_mode(): Determines current width tier
         - should_use_unicode(): Determines character set preference
+        - _BANNER_TABLE: Precomputed (use_unicode, width_tier) lookup
         
     Example:
         >>> state = ApplicationState()
@@ -1159,22 +1633,7 @@ def get_banner(state: Optional[ApplicationState] = None) -> str:
         >>> "╔" in banner  # Unicode box-drawing character
         True
     """
-    width_tier = get_width_mode(state)
-    
-    if should_use_unicode(state):
-        if width_tier == 'compact':
-            return COMPACT_UNICODE_BANNER
-        elif width_tier == 'wide':
-            return WIDE_UNICODE_BANNER
-        else:  # standard
-            return STANDARD_UNICODE_BANNER
-    else:
-        if width_tier == 'compact':
-            return COMPACT_ASCII_BANNER
-        elif width_tier == 'wide':
-            return WIDE_ASCII_BANNER
-        else:  # standard
-            return STANDARD_ASCII_BANNER
+    return _BANNER_TABLE[_display_key(state)]
 
 def get_access_granted(state: Optional[ApplicationState] = None) -> str:
     """
@@ -1200,6 +1659,7 @@ def get_access_granted(state: Optional[ApplicationState] = None) -> str:
     Dependencies:
         - get_width_mode(): Determines current terminal width tier
         - should_use_unicode(): Determines character set (ASCII vs Unicode)
+        - _ACCESS_GRANTED_TABLE: Precomputed (use_unicode, width_tier) lookup
         
     Usage:
         Called by show_access_granted() to display successful operation results
@@ -1214,22 +1674,7 @@ def get_access_granted(state: Optional[ApplicationState] = None) -> str:
         >>> "+" in access_box or "╔" in access_box
         True
     """
-    width_tier = get_width_mode(state)
-    
-    if should_use_unicode(state):
-        if width_tier == 'compact':
-            return COMPACT_UNICODE_ACCESS_GRANTED
-        elif width_tier == 'wide':
-            return WIDE_UNICODE_ACCESS_GRANTED
-        else:  # standard
-            return STANDARD_UNICODE_ACCESS_GRANTED
-    else:
-        if width_tier == 'compact':
-            return COMPACT_ACCESS_GRANTED
-        elif width_tier == 'wide':
-            return WIDE_ACCESS_GRANTED
-        else:  # standard
-            return STANDARD_ACCESS_GRANTED
+    return _ACCESS_GRANTED_TABLE[_display_key(state)]
 
 def get_warning_box(state: Optional[ApplicationState] = None) -> str:
     """
@@ -1260,6 +1705,7 @@ def get_warning_box(state: Optional[ApplicationState] = None) -> str:
     Dependencies:
         - get_width_mode(): Determines current terminal width tier
         - should_use_unicode(): Determines character set (ASCII vs Unicode)
+        - _WARNING_BOX_TABLE: Precomputed (use_unicode, width_tier) lookup
         
     Usage:
         Called by show_warning() to display security alerts before
@@ -1276,29 +1722,15 @@ def get_warning_box(state: Optional[ApplicationState] = None) -> str:
         >>> "+" in warning_box or "╔" in warning_box
         True
     """
-    width_tier = get_width_mode(state)
-    
-    if should_use_unicode(state):
-        if width_tier == 'compact':
-            return COMPACT_UNICODE_WARNING_BOX
-        elif width_tier == 'wide':
-            return WIDE_UNICODE_WARNING_BOX
-        else:  # standard
-            return STANDARD_UNICODE_WARNING_BOX
-    else:
-        if width_tier == 'compact':
-            return COMPACT_WARNING_BOX
-        elif width_tier == 'wide':
-            return WIDE_WARNING_BOX
-        else:  # standard
-            return STANDARD_WARNING_BOX
+    return _WARNING_BOX_TABLE[_display_key(state)]
 
-def get_progress_chars(state: Optional[ApplicationState] = None) -> Dict[str, str]:
+def get_progress_chars(state: Optional[ApplicationState] = None) -> Tuple[str, str]:
     """
     Get appropriate progress bar characters based on Unicode mode.
     
-    Returns a dictionary containing the filled and empty characters to use
-    for progress bar display, adapting to the current Unicode mode setting.
+    Returns a prebuilt (filled, empty) tuple of characters to use for progress
+    bar display, adapting to the current Unicode mode setting. No new object
+    is allocated per call.
     
     Args:
         state (ApplicationState, optional): Application state instance. If None, 
@@ -1309,11 +1741,11 @@ def get_progress_chars(state: Optional[ApplicationState] = None) -> Dict[str, st
         - ASCII mode: Uses # (hash) and . (period) for maximum compatibility
         
     Returns:
-        Dict[str, str]: Dictionary with 'filled' and 'empty' keys mapping to
-                       appropriate characters for progress bar rendering.
+        Tuple[str, str]: (filled, empty) characters for progress bar rendering.
                        
     Dependencies:
         - should_use_unicode(): Determines character set preference
+        - PROGRESS_CHARS_UNICODE / PROGRESS_CHARS_ASCII: Prebuilt character pairs
         
     Usage:
         Called by progress() function to render animated progress bars
@@ -1321,24 +1753,22 @@ def get_progress_chars(state: Optional[ApplicationState] = None) -> Dict[str, st
         
     Example:
         >>> state = ApplicationState()
-        >>> chars = get_progress_chars(state)
-        >>> 'filled' in chars and 'empty' in chars
+        >>> filled, empty = get_progress_chars(state)
+        >>> len(filled) == 1 and len(empty) == 1
         True
         >>> # Unicode mode
         >>> state.unicode_mode = "on"
-        >>> chars = get_progress_chars(state)  # Unicode on
-        >>> chars['filled'] == '█' and chars['empty'] == '░'
-        True
+        >>> get_progress_chars(state)  # Unicode on
+        ('█', '░')
         >>> # ASCII mode  
         >>> state.unicode_mode = "off"
-        >>> chars = get_progress_chars(state)  # Unicode off
-        >>> chars['filled'] == '#' and chars['empty'] == '.'
-        True
+        >>> get_progress_chars(state)  # Unicode off
+        ('#', '.')
     """
     if should_use_unicode(state):
-        return {'filled': '█', 'empty': '░'}
+        return PROGRESS_CHARS_UNICODE
     else:
-        return {'filled': '#', 'empty': '.'}
+        return PROGRESS_CHARS_ASCII
 
 
 def get_terminal_width() -> int:
@@ -1384,19 +1814,13 @@ def get_terminal_width() -> int:
     except (OSError, AttributeError):
         pass
     
-    # Fallback 1: COLUMNS environment variable
-    columns_env = os.environ.get('COLUMNS')
-    if columns_env and columns_env.isdigit():
-        columns = int(columns_env)
-        if columns > SIZE_GREATER_THAN_ZERO:
-            return columns
-    
-    # Fallback 2: TERM_COLS environment variable
-    term_cols_env = os.environ.get('TERM_COLS')
-    if term_cols_env and term_cols_env.isdigit():
-        term_cols = int(term_cols_env)
-        if term_cols > SIZE_GREATER_THAN_ZERO:
-            return term_cols
+    # Fallbacks 1 and 2: COLUMNS, then TERM_COLS environment variables
+    for var in TERMINAL_WIDTH_ENV_VARS:
+        value = os.environ.get(var)
+        if value and value.isdigit():
+            columns = int(value)
+            if columns > SIZE_GREATER_THAN_ZERO:
+                return columns
     
     # Final fallback: Default to 80 columns
     return DISPLAY_DEFAULT_TERMINAL_WIDTH
@@ -1446,7 +1870,105 @@ def classify_width(width: int) -> str:
         return 'wide'
 
 
+# Width tier cache - refreshed on SIGWINCH once main() has installed the
+# handler, otherwise (library use, Windows, handler not installable) after a
+# short TTL. Importers never have their SIGWINCH handler replaced.
+_cached_width_tier: Optional[str] = None
+_width_tier_dirty: bool = True
+_width_tier_checked_at: float = 0.0
+_resize_handler_state: Optional[bool] = None
+_previous_resize_handler: Any = None
+
+
+def _on_resize(signum: int, frame: Any) -> None:
+    """
+    SIGWINCH handler that marks the cached width tier as stale.
+    
+    Only sets a flag; the tier is recomputed lazily by the next
+    get_terminal_width_tier() call. Any handler that was installed before
+    ours is chained so embedding applications keep receiving the signal.
+    """
+    global _width_tier_dirty
+    _width_tier_dirty = True
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+
+
+def _install_resize_handler() -> bool:
+    """
+    Install the SIGWINCH handler; called once from main().
+    
+    Taking over the process-wide handler is only done by the CLI entry
+    point: code that merely imports this module (and calls get_banner() and
+    friends) keeps its own handler - including C-level ones such as
+    readline's or curses', which signal.signal() reports as None and which
+    therefore could not be chained - and gets the TTL-based refresh instead.
+    
+    Returns:
+        bool: True if resize notifications are available, False if the
+              platform has no SIGWINCH or the handler could not be installed
+              (e.g. when called outside the main thread).
+    """
+    global _resize_handler_state, _previous_resize_handler
+    if _resize_handler_state is None:
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None:
+            _resize_handler_state = False
+        else:
+            try:
+                _previous_resize_handler = signal.signal(sigwinch, _on_resize)
+                _resize_handler_state = True
+            except (ValueError, OSError):
+                _resize_handler_state = False
+    return _resize_handler_state
+
+
+def _invalidate_width_cache() -> None:
+    """
+    Force the next get_terminal_width_tier() call to re-detect the tier.
+    
+    Called by main() when the display modes are configured and by
+    ApplicationState.reset_state(), so a tier detected against an earlier
+    (since redirected or replaced) stdout is never reused.
+    """
+    global _width_tier_dirty
+    _width_tier_dirty = True
+
+
 def get_terminal_width_tier() -> str:
+    """
+    Get terminal width tier, cached until the terminal is resized.
+    
+    The detected tier is cached per process. Once main() has installed the
+    SIGWINCH handler the cache is invalidated when the terminal is resized;
+    otherwise it expires after TERMINAL_WIDTH_CACHE_TTL seconds. This keeps
+    the ioctl-backed terminal size query off the rendering hot path.
+    
+    Returns:
+        str: Width tier classification as 'compact', 'standard', or 'wide'.
+        
+    Dependencies:
+        - _detect_terminal_width_tier(): Uncached tier detection
+        - _install_resize_handler(): SIGWINCH registration (done by main())
+    """
+    global _cached_width_tier, _width_tier_dirty, _width_tier_checked_at
+    
+    if _resize_handler_state:
+        if not _width_tier_dirty and _cached_width_tier is not None:
+            return _cached_width_tier
+    else:
+        now = time.monotonic()
+        if (not _width_tier_dirty and _cached_width_tier is not None
+                and now - _width_tier_checked_at < TERMINAL_WIDTH_CACHE_TTL):
+            return _cached_width_tier
+        _width_tier_checked_at = now
+    
+    _width_tier_dirty = False
+    _cached_width_tier = _detect_terminal_width_tier()
+    return _cached_width_tier
+
+
+def _detect_terminal_width_tier() -> str:
     """
     Get terminal width tier with comprehensive edge case handling.
     
@@ -1479,11 +2001,11 @@ def get_terminal_width_tier() -> str:
         
     Example:
         >>> # In a normal terminal
-        >>> tier = get_terminal_width_tier()
+        >>> tier = _detect_terminal_width_tier()
         >>> tier in ['compact', 'standard', 'wide']
         True
         >>> # When output is redirected
-        >>> tier = get_terminal_width_tier()  # Non-TTY
+        >>> tier = _detect_terminal_width_tier()  # Non-TTY
         >>> tier == 'standard'
         True
     """
@@ -1544,7 +2066,7 @@ def get_width_mode(state: Optional[ApplicationState] = None) -> str:
     if state is None:
         state = app_state
     
-    if state.width_mode in ['compact', 'standard', 'wide']:
+    if state.width_mode in WIDTH_TIERS:
         # Explicit mode set via CLI argument
         return state.width_mode
     elif state.width_mode == 'auto':
@@ -1555,6 +2077,100 @@ def get_width_mode(state: Optional[ApplicationState] = None) -> str:
         return 'standard'
 
 
+@lru_cache(maxsize=None)
+def _progress_frames(steps: int, filled_char: str, empty_char: str) -> Tuple[str, ...]:
+    """
+    Render every frame of a progress bar animation once per bar shape.
+    
+    Frames depend only on the step count and character set, so the handful
+    of PROGRESS_BAR_STEPS_* values used by the commands are rendered on first
+    use and reused by every later progress() call.
+    
+    Args:
+        steps (int): Number of animation steps (frames are steps + 1).
+        filled_char (str): Character for the completed part of the bar.
+        empty_char (str): Character for the remaining part of the bar.
+        
+    Returns:
+        Tuple[str, ...]: Frame strings, each ending in a carriage return.
+    """
+    # Build the full-width runs once and slice each frame's bar out of them
+    filled_run = filled_char * steps
+    empty_run = empty_char * steps
+    
+    frames = []
+    for i in range(steps + STEP_INCREMENT):
+        bar = filled_run[:i] + empty_run[i:]
+        percent = int((i / steps) * 100)
+        
+        # Add scanning dots for effect
+        dots = PROGRESS_DOTS_CYCLE[i % PROGRESS_DOT_CYCLE_MODULO]
+        
+        frames.append(f"| [{bar}] {percent:{PROGRESS_PERCENTAGE_WIDTH}d}% {dots:<{PROGRESS_DOTS_WIDTH}} |\r")
+    return tuple(frames)
+
+
+@lru_cache(maxsize=None)
+def _progress_deltas(steps: int, filled_char: str, empty_char: str) -> Tuple[str, ...]:
+    """
+    Render each progress frame as an ANSI delta against the previous frame.
+    
+    The first entry is the full first frame. Every later entry skips over
+    unchanged columns with cursor-forward escapes (ESC[nC) and rewrites only
+    the cells that differ (the newly filled cell, percentage and dots),
+    then returns to column 0 with a carriage return, like the full frames.
+    
+    ESC[nC counts terminal cells, not characters, so a stray write to the
+    line (e.g. an echoed keystroke) would leave the bar misaligned. Every
+    PROGRESS_DELTA_RESYNC_INTERVAL-th frame and the final frame are
+    therefore full redraws, so any such damage self-corrects.
+    
+    Args:
+        steps (int): Number of animation steps (frames are steps + 1).
+        filled_char (str): Character for the completed part of the bar.
+        empty_char (str): Character for the remaining part of the bar.
+        
+    Returns:
+        Tuple[str, ...]: Delta strings, one per frame.
+        
+    Note:
+        Only valid for ANSI-capable terminals with single-width bar
+        characters; progress() uses it for the ASCII charset only, since the
+        Unicode block glyphs render double-width in some (CJK) locales.
+    """
+    frames = _progress_frames(steps, filled_char, empty_char)
+    last = len(frames) - 1
+    deltas = [frames[0]]
+    for number, (previous, frame) in enumerate(zip(frames, frames[1:]), STEP_INCREMENT):
+        if (len(previous) != len(frame) or number == last
+                or number % PROGRESS_DELTA_RESYNC_INTERVAL == 0):
+            deltas.append(frame)
+            continue
+        
+        parts = []
+        column = 0
+        index = 0
+        end = len(frame) - 1    # Trailing "\r" is common to every frame
+        while index < end:
+            if frame[index] == previous[index]:
+                index += 1
+                continue
+            start = index
+            while index < end and frame[index] != previous[index]:
+                index += 1
+            # Skip unchanged cells with an escape unless rewriting them is shorter
+            skip = f"\033[{start - column}C"
+            if start - column > len(skip):
+                parts.append(skip)
+            else:
+                parts.append(frame[column:start])
+            parts.append(frame[start:index])
+            column = index
+        parts.append("\r")
+        deltas.append("".join(parts))
+    return tuple(deltas)
+
+
 def progress(label: str = "Processing", steps: int = PROGRESS_BAR_STEPS_DEFAULT, delay: float = TIMING_PROGRESS_DEFAULT, state: Optional[ApplicationState] = None) -> None:
     """
     Display an animated progress bar with cinematic hacker-movie styling.
@@ -1593,8 +2209,21 @@ def progress(label: str = "Processing", steps: int = PROGRESS_BAR_STEPS_DEFAULT,
         - Unicode mode: Uses █ (filled block) and ░ (light shade)
         - ASCII mode: Uses # (hash) and . (period)
         
+    Output:
+        Each frame is a single sys.stdout.write(), flushed as it is drawn.
+        On ANSI-capable terminals using the ASCII charset only the changed
+        cells are rewritten, with periodic full redraws (see
+        _progress_deltas()); otherwise every frame is a full redraw.
+        Frames are scheduled on time.monotonic() ticks, so the total duration
+        stays close to (steps + 1) * delay regardless of rendering cost.
+        All delays are multiplied by state.delay_scale (--speed/--no-delay).
+        When stdout is not a TTY (pipes, files, CI logs) the animation is
+        skipped: only the completed 100% bar is written, without delays.
+        
     Dependencies:
         - get_progress_chars(): Character set selection
+        - _progress_frames(): Pre-rendered, cached animation frames
+        - _progress_deltas(): Cached ANSI delta frames for capable terminals
         - PROGRESS_BAR_WIDTH: Consistent bar width (52 chars)
         - Various timing and step constants
         
@@ -1604,25 +2233,97 @@ def progress(label: str = "Processing", steps: int = PROGRESS_BAR_STEPS_DEFAULT,
         >>> progress()  # Uses defaults
         # Displays "PROCESSING" with standard timing
     """
-    print(f"\n[{label.upper()}]")
-    print("+" + "-" * PROGRESS_BAR_WIDTH + "+")
+    if state is None:
+        state = app_state
     
-    chars = get_progress_chars(state)
+    out = sys.stdout
+    filled_char, empty_char = get_progress_chars(state)
+    frames = _progress_frames(steps, filled_char, empty_char)
+    delay *= state.delay_scale
     
-    for i in range(steps + STEP_INCREMENT):
-        filled = chars['filled'] * i
-        empty = chars['empty'] * (steps - i)
-        percent = int((i / steps) * 100)
-        
-        # Add scanning dots for effect
-        dots = "..." if i % PROGRESS_DOT_CYCLE_MODULO == 0 else ".." if i % PROGRESS_DOT_CYCLE_MODULO == 1 else "."
+    out.write(f"\n[{label.upper()}]\n{PROGRESS_BAR_RULE}\n")
+    
+    # Pipes, files and CI logs get the finished bar only - no carriage-return
+    # frames and no animation delays
+    if not out.isatty():
+        # steps < 0 yields no frames; emit just the borders, as the full
+        # animation path does in that case
+        final = frames[-1].rstrip("\r") if frames else ""
+        out.write(final + "\n" + PROGRESS_BAR_RULE + "\n")
+        return
+    
+    # ANSI terminals only need the cells that changed since the last frame.
+    # Cursor skips count cells, so this is limited to the single-width ASCII
+    # bar; the Unicode glyphs can be double-width (East Asian ambiguous).
+    if not should_use_unicode(state) and stdout_supports_ansi():
+        frames = _progress_deltas(steps, filled_char, empty_char)
+    
+    # Pace frames against a monotonic schedule so rendering time is absorbed
+    # into the delay instead of accumulating on top of it. The callables are
+    # bound once so each frame only does local lookups.
+    write, flush = out.write, out.flush
+    monotonic, sleep = time.monotonic, time.sleep
+    next_tick = monotonic()
+    for frame in frames:
+        write(frame)
+        flush()
+        next_tick += delay
+        remaining = next_tick - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+    
+    out.write("\n" + PROGRESS_BAR_RULE + "\n")
+    _sleep(TIMING_PROGRESS_END_DELAY, state)
+
+
+@lru_cache(maxsize=None)
+def _encode_block(text: str, encoding: str, errors: str) -> bytes:
+    """
+    Encode a constant text block (plus its trailing newline) once per stream
+    encoding.
+    
+    Args:
+        text (str): Constant text block, e.g. a banner, box or HELP_TEXT.
+        encoding (str): Target stream encoding (e.g. sys.stdout.encoding).
+        errors (str): Target stream error handler (e.g. sys.stdout.errors).
         
-        print(f"| [{filled}{empty}] {percent:{PROGRESS_PERCENTAGE_WIDTH}d}% {dots:<{PROGRESS_DOTS_WIDTH}} |", end="")
-        print("\r", end="", flush=True)
-        time.sleep(delay)
+    Returns:
+        bytes: Encoded block, ready to be written to the binary stdout buffer.
+    """
+    return (text + "\n").encode(encoding, errors)
+
+
+def _write_block(text: str) -> None:
+    """
+    Write a constant multi-line text block to stdout, skipping the per-call
+    text encoding.
+    
+    Used for the ASCII/Unicode art and the help text. Equivalent to
+    print(text), but the encoded bytes are cached per block (and per stream
+    encoding) and written straight to sys.stdout.buffer. Falls back to a
+    plain text write when stdout has no binary buffer (e.g. io.StringIO in
+    tests) or when the platform line ending is not "\n" (Windows), so
+    newline translation matches print(). Only pass constant strings - every
+    distinct text stays cached.
     
-    print("\n+" + "-" * PROGRESS_BAR_WIDTH + "+")
-    time.sleep(TIMING_PROGRESS_END_DELAY)
+    Args:
+        text (str): Constant text block, e.g. a get_* art string or HELP_TEXT.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    encoding = getattr(stream, "encoding", None)
+    # The bytes path bypasses the text layer's newline translation, so it is
+    # only used where "\n" is the native line ending (not on Windows, where
+    # print() writes "\r\n")
+    if buffer is None or not encoding or os.linesep != "\n":
+        stream.write(text + "\n")
+        return
+    
+    # Flush pending text first so output ordering is preserved
+    stream.flush()
+    buffer.write(_encode_block(text, encoding, stream.errors or "strict"))
+    if getattr(stream, "line_buffering", False):
+        stream.flush()
 
 
 def show_access_granted(state: Optional[ApplicationState] = None) -> None:
@@ -1651,6 +2352,7 @@ def show_access_granted(state: Optional[ApplicationState] = None) -> None:
         
     Dependencies:
         - get_access_granted(): Returns appropriate access granted box
+        - _write_block(): Writes the art through the cached encoded-bytes path
         - TIMING_ACCESS_GRANTED_DELAY: Controls dramatic pause duration
         
     Example:
@@ -1660,8 +2362,8 @@ def show_access_granted(state: Optional[ApplicationState] = None) -> None:
         # Pauses for dramatic effect
         # Returns after 1 second
     """
-    print(get_access_granted(state))
-    time.sleep(TIMING_ACCESS_GRANTED_DELAY)
+    _write_block(get_access_granted(state))
+    _sleep(TIMING_ACCESS_GRANTED_DELAY, state)
 
 
 def show_warning(state: Optional[ApplicationState] = None) -> None:
@@ -1694,6 +2396,7 @@ def show_warning(state: Optional[ApplicationState] = None) -> None:
         
     Dependencies:
         - get_warning_box(): Returns appropriate warning box
+        - _write_block(): Writes the art through the cached encoded-bytes path
         - TIMING_WARNING_DELAY: Controls dramatic pause duration (1.5 seconds)
         
     Example:
@@ -1703,8 +2406,8 @@ def show_warning(state: Optional[ApplicationState] = None) -> None:
         # Pauses for 1.5 seconds to build tension
         # Returns to allow operation to proceed
     """
-    print(get_warning_box(state))
-    time.sleep(TIMING_WARNING_DELAY)
+    _write_block(get_warning_box(state))
+    _sleep(TIMING_WARNING_DELAY, state)
 
 
 def ascii_banner(state: Optional[ApplicationState] = None) -> None:
@@ -1738,6 +2441,7 @@ def ascii_banner(state: Optional[ApplicationState] = None) -> None:
         
     Dependencies:
         - get_banner(): Returns appropriate banner based on current settings
+        - _write_block(): Writes the art through the cached encoded-bytes path
         - Terminal width and Unicode detection systems
         
     Example:
@@ -1746,12 +2450,18 @@ def ascii_banner(state: Optional[ApplicationState] = None) -> None:
         # Displays width and Unicode-appropriate banner
         # No return value, output goes directly to stdout
     """
-    print(get_banner(state))
+    _write_block(get_banner(state))
+
+
 
 
+# Module-local generator: seeding it (demo/single-command determinism) does not
+# touch the interpreter-wide random state, and calls skip the module-level
+# random.* function indirection
+_rng = random.Random()
 
 
-def random_line(options: List[str]) -> str:
+def random_line(options: Sequence[str]) -> str:
     """
     Return a randomly selected line from a list of options.
     
@@ -1760,15 +2470,15 @@ def random_line(options: List[str]) -> str:
     deterministic behavior when a specific random seed is set.
     
     Args:
-        options (List[str]): List of string options to choose from.
+        options (Sequence[str]): List or tuple of string options to choose from.
                            Must contain at least one element.
                            
     Returns:
         str: Randomly selected string from the options list.
         
     Randomization:
-        - Uses Python's random.choice() for selection
-        - Respects any random seed set via random.seed()
+        - Uses the module-local _rng.choice() for selection
+        - Respects any random seed set via _rng.seed()
         - Demo mode uses deterministic seed for consistent output
         - Interactive mode uses system randomization
         
@@ -1783,11 +2493,11 @@ def random_line(options: List[str]) -> str:
         >>> result in messages
         True
         >>> # With deterministic seed
-        >>> random.seed(1337)
+        >>> _rng.seed(1337)
         >>> random_line(["A", "B", "C"])
         'B'  # Consistent result with same seed
     """
-    return random.choice(options)
+    return _rng.choice(options)
 
 
 # =============================================================================
@@ -1829,6 +2539,10 @@ def cmd_help() -> None:
         Available in all modes (interactive, single command, demo).
         No arguments required.
         
+    Dependencies:
+        - HELP_TEXT: Preformatted help menu
+        - _write_block(): Cached encoded-bytes output path
+        
     Example:
         >>> cmd_help()
         Available commands:
@@ -1836,18 +2550,7 @@ def cmd_help() -> None:
           scan                    - Scan for targets
           ...
     """
-    help_text = """Available commands:
-  help                    - Show this help
-  scan                    - Scan for targets
-  decrypt                 - Decrypt intercepted data
-  infiltrate <target>     - Infiltrate specified target
-  hack                    - Execute hack sequence
-  trace <target>          - Trace target location
-  countertrace|evade      - Counter enemy traces
-  status                  - Show system status
-  clear                   - Clear terminal
-  exit                    - Exit terminal"""
-    print(help_text)
+    _write_block(HELP_TEXT)
 
 
 def cmd_scan(state: Optional[ApplicationState] = None) -> None:
@@ -1908,15 +2611,12 @@ def cmd_scan(state: Optional[ApplicationState] = None) -> None:
     progress("Scanning network", PROGRESS_BAR_STEPS_SCAN, TIMING_PROGRESS_SCAN, state)
     
     # Fixed targets to match SCOPE.md demo exactly
-    state.discovered_targets = [
-        ("MAINFRAME-7", "low"),
-        ("QUANTUM-DB", "high"), 
-        ("SATELLITE-X", "medium")
-    ]
+    state.set_discovered_targets(SCAN_TARGETS)
     
-    print(f"Found {len(state.discovered_targets)} targets:")
-    for name, security in state.discovered_targets:
-        print(f"- {name} (security: {security})")
+    # One write for the whole target listing
+    lines = [f"Found {len(state.discovered_targets)} targets:"]
+    lines.extend(f"- {name} (security: {security})" for name, security in state.discovered_targets)
+    print("\n".join(lines))
 
 
 def cmd_decrypt() -> None:
@@ -1962,19 +2662,11 @@ def cmd_decrypt() -> None:
         - progress(): Animated progress bar display
         - random_line(): Random message selection
         - PROGRESS_BAR_STEPS_DECRYPT, TIMING_PROGRESS_DECRYPT: Animation parameters
+        - DECRYPT_MESSAGES: Pool of decrypted messages
     """
     progress("Decrypting data", PROGRESS_BAR_STEPS_DECRYPT, TIMING_PROGRESS_DECRYPT)
     
-    messages = [
-        "THE CAKE IS A LIE",
-        "TRUST NO ONE",
-        "FOLLOW THE WHITE RABBIT", 
-        "THE MATRIX HAS YOU",
-        "WAKE UP NEO",
-        "I AM ROOT"
-    ]
-    
-    message = random_line(messages)
+    message = random_line(DECRYPT_MESSAGES)
     print(f'Decrypted message: "{message}"')
 
 
@@ -1996,7 +2688,7 @@ def cmd_infiltrate(target: Optional[str], state: Optional[ApplicationState] = No
     Operation Sequence:
         1. Validate target argument is provided
         2. Convert target name to uppercase for consistency
-        3. Verify target exists in discovered_targets list
+        3. Verify target exists in the discovered_target_names index
         4. Display security warning with dramatic pause
         5. Show infiltration progress animation
         6. Add target to infiltrated_targets set
@@ -2049,8 +2741,7 @@ def cmd_infiltrate(target: Optional[str], state: Optional[ApplicationState] = No
     target = target.upper()
     
     # Check if target was discovered
-    target_names = [name for name, _ in state.discovered_targets]
-    if target not in target_names:
+    if target not in state.discovered_target_names:
         print("Target not found. Run 'scan' first.")
         return
     
@@ -2094,7 +2785,7 @@ def cmd_hack(state: Optional[ApplicationState] = None) -> None:
         - Longest progress sequence to emphasize operation complexity
         
     State Changes:
-        Updates application state system_status dictionary:
+        Updates application state system_status record:
         - compromised_systems: Set to 5
         - credits: Set to 1337
         
@@ -2132,13 +2823,15 @@ def cmd_hack(state: Optional[ApplicationState] = None) -> None:
     systems = DEMO_HACK_SYSTEMS
     credits = DEMO_HACK_CREDITS
     
-    state.system_status["compromised_systems"] = systems
-    state.system_status["credits"] = credits
+    state.system_status.compromised_systems = systems
+    state.system_status.credits = credits
     
     show_access_granted(state)
-    print("HACK SUCCESSFUL")
-    print(f"Systems compromised: {systems}")
-    print(f"Credits earned: {credits}")
+    print(
+        "HACK SUCCESSFUL\n"
+        f"Systems compromised: {systems}\n"
+        f"Credits earned: {credits}"
+    )
 
 
 def cmd_trace(target: Optional[str]) -> None:
@@ -2202,7 +2895,8 @@ def cmd_trace(target: Optional[str]) -> None:
     Dependencies:
         - progress(): Triangulation progress animation
         - PREDEFINED_LOCATIONS: Known target location database
-        - random.uniform(): Random coordinate generation for unknown targets
+        - TRACE_FALLBACK_ISPS: ISP names for unknown targets
+        - _rng.uniform(): Random coordinate generation for unknown targets
         - Coordinate and ISP name constants
     """
     if not target:
@@ -2215,19 +2909,17 @@ def cmd_trace(target: Optional[str]) -> None:
     progress("Triangulating position", PROGRESS_BAR_STEPS_TRACE, TIMING_PROGRESS_TRACE)
     
     # Predefined locations for consistency
-    locations = PREDEFINED_LOCATIONS
+    location = PREDEFINED_LOCATIONS.get(target)
     
-    if target in locations:
-        coords, isp = locations[target]
-        print(f"Location found: {coords}")
-        print(f"ISP: {isp}")
+    if location is not None:
+        coords, isp = location
+        print(f"Location found: {coords}\nISP: {isp}")
     else:
         # Fallback for unknown targets
-        lat = round(random.uniform(COORDINATE_LAT_MIN, COORDINATE_LAT_MAX), COORDINATE_PRECISION)
-        lon = round(random.uniform(COORDINATE_LON_MIN, COORDINATE_LON_MAX), COORDINATE_PRECISION)
-        isps = ["CyberCorp Industries", "TechMax Solutions", "DataFlow Systems"]
-        print(f"Location found: {lat} deg N, {lon} deg W")
-        print(f"ISP: {random_line(isps)}")
+        uniform = _rng.uniform
+        lat = round(uniform(COORDINATE_LAT_MIN, COORDINATE_LAT_MAX), COORDINATE_PRECISION)
+        lon = round(uniform(COORDINATE_LON_MIN, COORDINATE_LON_MAX), COORDINATE_PRECISION)
+        print(f"Location found: {lat} deg N, {lon} deg W\nISP: {random_line(TRACE_FALLBACK_ISPS)}")
 
 
 def cmd_countertrace() -> None:
@@ -2300,7 +2992,7 @@ def cmd_status(state: Optional[ApplicationState] = None) -> None:
         - Stealth Mode: ON/OFF (stealth operation status)
         
     Status Sources:
-        All information retrieved from the application state system_status dictionary
+        All information retrieved from the application state system_status record
         which is updated by various operational commands:
         - cmd_hack(): Updates compromised_systems and credits
         - System initialization: Sets default security parameters
@@ -2313,11 +3005,11 @@ def cmd_status(state: Optional[ApplicationState] = None) -> None:
         Stealth Mode: ON
         
     State Dependencies:
-        - state.system_status['online']: System connectivity status
-        - state.system_status['security_level']: Current security posture
-        - state.system_status['connections']: Active network connections count
-        - state.system_status['firewall']: Firewall protection status
-        - state.system_status['stealth']: Stealth mode operational status
+        - state.system_status.online: System connectivity status
+        - state.system_status.security_level: Current security posture
+        - state.system_status.connections: Active network connections count
+        - state.system_status.firewall: Firewall protection status
+        - state.system_status.stealth: Stealth mode operational status
         
     Usage:
         >>> state = ApplicationState()
@@ -2335,16 +3027,16 @@ def cmd_status(state: Optional[ApplicationState] = None) -> None:
     if state is None:
         state = app_state
     
-    status_map = {
-        True: STATUS_ENABLED,
-        False: STATUS_DISABLED
-    }
+    status = state.system_status
     
-    print(f"System Status: {STATUS_ONLINE if state.system_status['online'] else STATUS_OFFLINE}")
-    print(f"Security Level: {state.system_status['security_level']}")
-    print(f"Active Connections: {state.system_status['connections']}")
-    print(f"Firewall: {status_map[state.system_status['firewall']]}")
-    print(f"Stealth Mode: {STATUS_STEALTH_ON if state.system_status['stealth'] else STATUS_STEALTH_OFF}")
+    # Build the whole block first so it goes out in a single write
+    print(
+        f"System Status: {STATUS_ONLINE if status.online else STATUS_OFFLINE}\n"
+        f"Security Level: {status.security_level}\n"
+        f"Active Connections: {status.connections}\n"
+        f"Firewall: {STATUS_ENABLED if status.firewall else STATUS_DISABLED}\n"
+        f"Stealth Mode: {STATUS_STEALTH_ON if status.stealth else STATUS_STEALTH_OFF}"
+    )
 
 
 def cmd_clear() -> None:
@@ -2356,9 +3048,11 @@ def cmd_clear() -> None:
     Provides a clean slate for continued hacker terminal operations.
     
     System Compatibility:
-        - Windows (os.name == 'nt'): Executes 'cls' command
-        - Unix-like systems (Linux, macOS): Executes 'clear' command
-        - Uses os.system() for direct shell command execution
+        - ANSI-capable TTYs (Unix-like systems, Windows Terminal): Writes
+          ANSI_CLEAR_SCREEN directly, without spawning a shell
+        - Windows legacy console (os.name == 'nt'): Executes 'cls' command
+        - Non-TTY output on Unix-like systems: Executes 'clear' command
+        - Uses os.system() only for the fallback paths
         
     Usage:
         >>> cmd_clear()
@@ -2376,7 +3070,11 @@ def cmd_clear() -> None:
         the commands ('cls', 'clear') are safe system utilities with no
         security implications for the host system.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if stdout_supports_ansi():
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
+        return
+    os.system(CLEAR_SCREEN_COMMAND)
 
 
 def cmd_exit() -> None:
@@ -2417,8 +3115,7 @@ def cmd_exit() -> None:
         This function never returns - it terminates the entire Python process.
         Any code after cmd_exit() will not be executed.
     """
-    print("Connection terminated.")
-    print("Stay anonymous, hacker.")
+    print("Connection terminated.\nStay anonymous, hacker.")
     sys.exit(EXIT_SUCCESS)
 
 
@@ -2444,11 +3141,10 @@ def parse_command(command_line: str) -> Tuple[Optional[str], List[str]]:
             - arguments: List of remaining words, or empty list if no arguments
             
     Parsing Logic:
-        1. Strip leading and trailing whitespace
-        2. Split on whitespace into parts
-        3. Return None if no parts (empty input)
-        4. Convert first part to lowercase for case-insensitive commands
-        5. Return remaining parts as argument list
+        1. Split off the first word (leading/trailing whitespace ignored)
+        2. Return None if there is no word (empty input)
+        3. Convert the first word to lowercase for case-insensitive commands
+        4. Split only the remainder into the argument list
         
     Case Handling:
         - Commands are converted to lowercase for consistent lookup
@@ -2473,12 +3169,38 @@ def parse_command(command_line: str) -> Tuple[Optional[str], List[str]]:
         
     Dependencies:
         - COMMAND_PARTS_FIRST_INDEX: Constant for first element index (0)
-        - ARRAY_SLICE_START: Constant for argument slice start (1)
+        - COMMAND_HEAD_MAX_SPLIT: Split limit for the command word (1)
+        - ARRAY_SLICE_START: Constant for the remainder index (1)
     """
-    parts = command_line.strip().split()
+    parts = command_line.split(None, COMMAND_HEAD_MAX_SPLIT)
     if not parts:
         return None, []
-    return parts[COMMAND_PARTS_FIRST_INDEX].lower(), parts[ARRAY_SLICE_START:]
+    command = parts[COMMAND_PARTS_FIRST_INDEX].lower()
+    if len(parts) > ARRAY_SLICE_START:
+        return command, parts[ARRAY_SLICE_START].split()
+    return command, []
+
+
+def _first_arg(args: List[str]) -> Optional[str]:
+    """Return the first command argument, or None if there are no arguments."""
+    return args[COMMAND_ARGS_FIRST_INDEX] if args else None
+
+
+# Command dispatch table - each handler takes (args, state). Aliases share
+# the same entry, so routing is a single dict lookup per command.
+COMMAND_DISPATCH: Dict[str, Callable[[List[str], ApplicationState], None]] = {
+    "help": lambda args, state: cmd_help(),
+    "scan": lambda args, state: cmd_scan(state),
+    "decrypt": lambda args, state: cmd_decrypt(),
+    "infiltrate": lambda args, state: cmd_infiltrate(_first_arg(args), state),
+    "hack": lambda args, state: cmd_hack(state),
+    "trace": lambda args, state: cmd_trace(_first_arg(args)),
+    "countertrace": lambda args, state: cmd_countertrace(),
+    "evade": lambda args, state: cmd_countertrace(),
+    "status": lambda args, state: cmd_status(state),
+    "clear": lambda args, state: cmd_clear(),
+    "exit": lambda args, state: cmd_exit(),
+}
 
 
 def execute_command(cmd: Optional[str], args: List[str], state: Optional[ApplicationState] = None) -> bool:
@@ -2538,39 +3260,20 @@ def execute_command(cmd: Optional[str], args: List[str], state: Optional[Applica
         False  # Empty input
         
     Dependencies:
+        - COMMAND_DISPATCH: Command name to handler table (one dict lookup)
         - All cmd_* functions for command implementation
-        - COMMAND_ARGS_FIRST_INDEX: Constant for first argument index (0)
     """
     if state is None:
         state = app_state
     
     if cmd is None:
         return False
-    elif cmd == "help":
-        cmd_help()
-    elif cmd == "scan":
-        cmd_scan(state)
-    elif cmd == "decrypt":
-        cmd_decrypt()
-    elif cmd == "infiltrate":
-        target = args[COMMAND_ARGS_FIRST_INDEX] if args else None
-        cmd_infiltrate(target, state)
-    elif cmd == "hack":
-        cmd_hack(state)
-    elif cmd == "trace":
-        target = args[COMMAND_ARGS_FIRST_INDEX] if args else None
-        cmd_trace(target)
-    elif cmd in ["countertrace", "evade"]:
-        cmd_countertrace()
-    elif cmd == "status":
-        cmd_status(state)
-    elif cmd == "clear":
-        cmd_clear()
-    elif cmd == "exit":
-        cmd_exit()
-    else:
+    
+    handler = COMMAND_DISPATCH.get(cmd)
+    if handler is None:
         print("Command not recognized. Type 'help' for available commands.")
         return False
+    handler(args, state)
     return True
 
 
@@ -2602,7 +3305,7 @@ def run_demo_script(state: Optional[ApplicationState] = None) -> None:
         7. exit - Clean application termination
         
     Randomization Control:
-        - Sets random.seed(1337) for deterministic behavior
+        - Sets _rng.seed(1337) for deterministic behavior
         - Ensures identical messages, coordinates, and animations
         - Critical for consistent demo output and testing
         
@@ -2634,7 +3337,8 @@ def run_demo_script(state: Optional[ApplicationState] = None) -> None:
               uses the global app_state instance.
     
     Dependencies:
-        - random.seed(): Deterministic randomization
+        - _rng.seed(): Deterministic randomization
+        - DEMO_COMMANDS: Fixed demo command sequence
         - ascii_banner(): Banner display
         - parse_command(), execute_command(): Command processing pipeline
         - All command implementation functions
@@ -2643,28 +3347,18 @@ def run_demo_script(state: Optional[ApplicationState] = None) -> None:
         state = app_state
     
     # Set deterministic seed
-    random.seed(DEMO_RANDOM_SEED)
+    _rng.seed(DEMO_RANDOM_SEED)
     
     ascii_banner(state)
     
     # Demo command sequence
-    demo_commands = [
-        "scan",
-        "infiltrate MAINFRAME-7", 
-        "hack",
-        "trace QUANTUM-DB",
-        "countertrace",
-        "status",
-        "exit"
-    ]
-    
-    for command_line in demo_commands:
+    for command_line in DEMO_COMMANDS:
         print(f"\n> {command_line}")
         cmd, args = parse_command(command_line)
         execute_command(cmd, args, state)
 
 
-def interactive_mode(state: Optional[ApplicationState] = None) -> None:
+def interactive_mode(state: Optional[ApplicationState] = None, show_banner: bool = True) -> None:
     """
     Run the interactive terminal mode with comprehensive error handling.
     
@@ -2675,6 +3369,8 @@ def interactive_mode(state: Optional[ApplicationState] = None) -> None:
     Args:
         state (ApplicationState, optional): Application state instance. If None, 
               uses the global app_state instance.
+        show_banner (bool): Display the startup banner. main() passes False
+              when it has already shown the banner before falling back here.
     
     Interactive Features:
         - Real-time command processing with immediate feedback
@@ -2742,7 +3438,8 @@ def interactive_mode(state: Optional[ApplicationState] = None) -> None:
     if state is None:
         state = app_state
     
-    ascii_banner(state)
+    if show_banner:
+        ascii_banner(state)
     
     try:
         while True:
@@ -2762,6 +3459,67 @@ def interactive_mode(state: Optional[ApplicationState] = None) -> None:
         cmd_exit()
 
 
+def _positive_float(value: str) -> float:
+    """
+    argparse type for --speed: parse a strictly positive float.
+    
+    The value becomes the delay multiplier 1 / N, so speeds below
+    1 / TIMING_DELAY_SCALE_MAX are rejected as well - tiny values would
+    otherwise overflow into huge (or infinite) time.sleep() arguments.
+    
+    Args:
+        value (str): Raw command line value.
+        
+    Returns:
+        float: Parsed value, guaranteed to be finite and
+               >= 1 / TIMING_DELAY_SCALE_MAX.
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive number
+            or is too small.
+    """
+    import argparse   # already loaded by main(); see the note there
+    
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value!r}")
+    if not number > 0 or not math.isfinite(number):
+        raise argparse.ArgumentTypeError(f"speed must be a positive number, got {value!r}")
+    if number * TIMING_DELAY_SCALE_MAX < 1.0:
+        raise argparse.ArgumentTypeError(
+            f"speed must be at least {1.0 / TIMING_DELAY_SCALE_MAX:g}, got {value!r}"
+        )
+    return number
+
+
+def _resolve_delay_scale(speed: Optional[float], no_delay: bool) -> float:
+    """
+    Work out the animation delay multiplier from the command line flags.
+    
+    Args:
+        speed (Optional[float]): --speed value, or None if not given.
+        no_delay (bool): True if --no-delay was given.
+        
+    Returns:
+        float: Multiplier for every animation delay (0.0 disables them).
+        
+    Resolution Order:
+        1. --no-delay: 0.0
+        2. --speed N: 1 / N
+        3. stdout is not a TTY (pipes, files, CI): 0.0, since nobody is
+           watching the pauses and progress bars already skip animation there
+        4. Otherwise: TIMING_DELAY_SCALE_DEFAULT (1.0)
+    """
+    if no_delay:
+        return 0.0
+    if speed is not None:
+        return 1.0 / speed
+    if not sys.stdout.isatty():
+        return 0.0
+    return TIMING_DELAY_SCALE_DEFAULT
+
+
 def main() -> None:
     """
     Main application entry point with comprehensive argument processing and mode selection.
@@ -2776,6 +3534,8 @@ def main() -> None:
         --interactive: Force interactive mode
         --unicode auto|on|off: Unicode display mode control
         --width auto|compact|standard|wide: Terminal width override
+        --speed N: Animation speed multiplier (2 = twice as fast)
+        --no-delay: Skip all animation delays (default when not a TTY)
         command [args]: Execute single command
         
     Execution Modes:
@@ -2802,6 +3562,7 @@ def main() -> None:
         - app_state.unicode_mode: Controls ASCII vs Unicode art selection
         - app_state.width_mode: Controls terminal width adaptation
         - Both affect banner display and progress bar characters
+        - app_state.delay_scale: Scales animation delays (--speed, --no-delay)
         
     Error Handling:
         - KeyboardInterrupt: Clean "Program interrupted" termination
@@ -2830,6 +3591,7 @@ def main() -> None:
         $ python masterhacker.py scan
         $ python masterhacker.py infiltrate MAINFRAME-7
         $ python masterhacker.py --unicode off --width compact
+        $ python masterhacker.py --script demo --no-delay
         
     Dependencies:
         - argparse: Command line argument processing
@@ -2839,6 +3601,9 @@ def main() -> None:
         - ascii_banner(): Banner display for all modes
         - ApplicationState app_state instance
     """
+    # argparse (and its gettext/re/textwrap imports) is only needed here, so
+    # it is imported lazily rather than paid for by every importer
+    import argparse
     
     parser = argparse.ArgumentParser(
         description="Master Hacker Terminal v2.0"
@@ -2850,13 +3615,13 @@ def main() -> None:
     )
     parser.add_argument(
         "--unicode",
-        choices=["auto", "on", "off"],
+        choices=UNICODE_MODES,
         default="auto",
         help="Unicode art mode: auto (detect), on (force), off (ASCII only)"
     )
     parser.add_argument(
         "--width",
-        choices=["auto", "compact", "standard", "wide"],
+        choices=WIDTH_MODES,
         default="auto",
         help="Terminal width mode: auto (detect), compact (≤62 chars), standard (63-99 chars), wide (≥100 chars)"
     )
@@ -2865,6 +3630,18 @@ def main() -> None:
         action="store_true",
         help="Enter interactive mode"
     )
+    parser.add_argument(
+        "--speed",
+        type=_positive_float,
+        default=None,
+        help="Animation speed multiplier: 2 runs twice as fast, 0.5 at half speed "
+             "(default: 1, or no delays when output is not a terminal)"
+    )
+    parser.add_argument(
+        "--no-delay",
+        action="store_true",
+        help="Skip all animation delays (useful for CI and scripted runs)"
+    )
     parser.add_argument(
         "command",
         nargs="*",
@@ -2876,32 +3653,33 @@ def main() -> None:
     # Set application state Unicode and width modes
     app_state.unicode_mode = args.unicode
     app_state.width_mode = args.width
+    app_state.delay_scale = _resolve_delay_scale(args.speed, args.no_delay)
+    _reset_unicode_cache()
+    _install_resize_handler()
+    _invalidate_width_cache()
     
     try:
         if args.script == "demo":
             run_demo_script(app_state)
         elif args.interactive:
             # Explicit interactive mode
-            random.seed()
+            _rng.seed()
             interactive_mode(app_state)
         elif args.command:
-            # Single command mode
+            # Single command mode - the banner is shown once, up front
             cmd, cmd_args = parse_command(" ".join(args.command))
-            if cmd:
-                # Set seed for consistent output in single command mode too
-                random.seed(DEMO_RANDOM_SEED)
-                ascii_banner(app_state)
-                if not execute_command(cmd, cmd_args, app_state):
-                    # Command was invalid - enter interactive mode
-                    print("Entering interactive mode...")
-                    random.seed()
-                    interactive_mode(app_state)
-            else:
-                # Empty command - show banner and enter interactive mode
-                ascii_banner(app_state)
+            ascii_banner(app_state)
+            if cmd is None:
                 print("Empty command. Entering interactive mode...")
-                random.seed()
-                interactive_mode(app_state)
+            else:
+                # Set seed for consistent output in single command mode too
+                _rng.seed(DEMO_RANDOM_SEED)
+                if execute_command(cmd, cmd_args, app_state):
+                    return
+                # Command was invalid - enter interactive mode
+                print("Entering interactive mode...")
+            _rng.seed()
+            interactive_mode(app_state, show_banner=False)
         else:
             # No arguments provided - show banner and exit cleanly
             ascii_banner(app_state)